@@ -8,10 +8,22 @@ import re
 import time
 import uuid
 
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
 from pacemaker.buildoptions import BuildOptions
 from pacemaker._cts.input import should_continue
 from pacemaker._cts.watcher import LogKind, LogWatcher
 
+# Regular expressions used inside per-node and per-line loops
+_SIMPLE_HOST_RE = re.compile(r"^([^.]+)")
+_INT_RE = re.compile(r"-?\d+")
+
+# Resource flags, as reported by crm_resource --list-cts
+_FLAG_ORPHAN = 0x01
+_FLAG_MANAGED = 0x02
+_FLAG_UNIQUE = 0x20
+
 
 class ClusterAudit:
     """
@@ -23,6 +35,10 @@ class ClusterAudit:
     if it fails.
     """
 
+    # Prefix for lines separating the output of each command run in a single
+    # remote shell (see _split_sections)
+    _SECTION = "cts-section:"
+
     def __init__(self, cm):
         """
         Create a new ClusterAudit instance.
@@ -46,13 +62,50 @@ class ClusterAudit:
         """
         raise NotImplementedError
 
+    def _parallel(self, nodes, func, max_workers=None):
+        """
+        Call a function once for each of the given nodes, all at the same time.
+
+        For running a remote command on each node, use ClusterManager.rsh_all
+        instead.
+
+        Arguments:
+        nodes       -- The nodes to call func for
+        func        -- A function that takes a node as its only argument
+        max_workers -- The maximum number of calls to run at once, or None to
+                       use ClusterManager.rsh_fanout
+
+        Yields a tuple of (node, return value of func) for each node, in the
+        order the nodes were given.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers or self._cm.rsh_fanout) as executor:
+            futures = [executor.submit(func, node) for node in nodes]
+
+            for (node, future) in zip(nodes, futures):
+                yield (node, future.result())
+
+    def _split_sections(self, lines):
+        """Split remote command output into a dict of lists, keyed by section marker."""
+        sections = {}
+        current = None
+
+        for line in lines:
+            if line.startswith(self._SECTION):
+                current = line[len(self._SECTION):].strip()
+                sections[current] = []
+
+            elif current is not None:
+                sections[current].append(line)
+
+        return sections
+
     def log(self, args):
         """Log a message."""
         self._cm.log(f"audit: {args}")
 
-    def debug(self, args):
-        """Log a debug message."""
-        self._cm.debug(f"audit: {args}")
+    def debug(self, args, *fmt_args):
+        """Log a debug message, with optional %-style arguments (see LogFactory.debug)."""
+        self._cm.debug(f"audit: {args}", *fmt_args)
 
 
 class LogAudit(ClusterAudit):
@@ -63,6 +116,9 @@ class LogAudit(ClusterAudit):
     can read back that test message using logging tools.
     """
 
+    # Prefix for lines reporting a failed step when restarting logging
+    _FAILED_STEP = "cts-failed-step:"
+
     def __init__(self, cm):
         """
         Create a new LogAudit instance.
@@ -80,20 +136,36 @@ class LogAudit(ClusterAudit):
 
         self._cm.debug(f"Restarting logging on: {nodes!r}")
 
+        # Each step is a command and the error message to log if it fails
+        steps = []
+
+        if self._cm.env["have_systemd"]:
+            steps.extend([
+                ("systemctl stop systemd-journald.socket", "Cannot stop 'systemd-journald'"),
+                ("systemctl start systemd-journald.service", "Cannot start 'systemd-journald'"),
+            ])
+
+        if "syslogd" in self._cm.env:
+            steps.append((f"service {self._cm.env['syslogd']} restart",
+                          f"""Cannot restart '{self._cm.env["syslogd"]}'"""))
+
+        if not steps:
+            return
+
+        # Run all steps in a single remote shell, which reports the index of
+        # each step that failed
+        cmd = "; ".join(f"{step} || echo {self._FAILED_STEP}{i}"
+                        for (i, (step, _)) in enumerate(steps))
+
         for node in nodes:
-            if self._cm.env["have_systemd"]:
-                (rc, _) = self._cm.rsh(node, "systemctl stop systemd-journald.socket")
-                if rc != 0:
-                    self._cm.log(f"ERROR: Cannot stop 'systemd-journald' on {node}")
+            (_, lines) = self._cm.rsh(node, cmd)
 
-                (rc, _) = self._cm.rsh(node, "systemctl start systemd-journald.service")
-                if rc != 0:
-                    self._cm.log(f"ERROR: Cannot start 'systemd-journald' on {node}")
+            for line in lines:
+                line = line.strip()
 
-            if "syslogd" in self._cm.env:
-                (rc, _) = self._cm.rsh(node, f"service {self._cm.env['syslogd']} restart")
-                if rc != 0:
-                    self._cm.log(f"""ERROR: Cannot restart '{self._cm.env["syslogd"]}' on {node}""")
+                if line.startswith(self._FAILED_STEP):
+                    i = int(line[len(self._FAILED_STEP):])
+                    self._cm.log(f"ERROR: {steps[i][1]} on {node}")
 
     def _create_watcher(self, patterns, kind):
         """Create a new LogWatcher instance for the given patterns."""
@@ -104,7 +176,11 @@ class LogAudit(ClusterAudit):
         return watch
 
     def _test_logging(self):
-        """Perform the log audit."""
+        """
+        Perform the log audit.
+
+        Return the LogKind the test message was found in, or None.
+        """
         patterns = []
         prefix = "Test message from"
         suffix = str(uuid.uuid4())
@@ -113,13 +189,15 @@ class LogAudit(ClusterAudit):
         for node in self._cm.env["nodes"]:
             # Look for the node name in two places to make sure
             # that syslog is logging with the correct hostname
-            m = re.search("^([^.]+).*", node)
+            m = _SIMPLE_HOST_RE.match(node)
             if m:
                 simple = m.group(1)
             else:
                 simple = node
 
-            patterns.append(f"{simple}.*{prefix} {node} {suffix}")
+            # The watchers search every new log line for every pattern, so
+            # only compile each of them once
+            patterns.append(re.compile(f"{simple}.*{prefix} {node} {suffix}"))
 
         watch_pref = self._cm.env["log_kind"]
         if watch_pref is None:
@@ -141,37 +219,41 @@ class LogAudit(ClusterAudit):
             if rc != 0:
                 self._cm.log(f"ERROR: Cannot execute remote command [{cmd}] on {node}")
 
-        for k in list(watch.keys()):
-            w = watch[k]
+        for (k, w) in watch.items():
             if watch_pref is None:
                 self._cm.log(f"Checking for test message in {k} logs")
             w.look_for_all(silent=True)
             if w.unmatched:
                 for regex in w.unmatched:
-                    self._cm.log(f"Test message [{regex}] not found in {w.kind} logs")
+                    self._cm.log(f"Test message [{regex.pattern}] not found in {w.kind} logs")
             else:
                 if watch_pref is None:
                     self._cm.log(f"Found test message in {k} logs")
-                    self._cm.env["log_kind"] = k
-                return 1
+                return k
 
-        return False
+        return None
 
     def __call__(self):
         """Perform the audit action."""
         max_attempts = 3
         attempt = 0
 
+        retry_interval = self._cm.env["LogAuditRetrySeconds"]
+
         self._cm.ns.wait_for_all_nodes(self._cm.env["nodes"])
-        while attempt <= max_attempts and not self._test_logging():
+        kind = self._test_logging()
+
+        while attempt <= max_attempts and kind is None:
             attempt += 1
             self._restart_cluster_logging()
-            time.sleep(60 * attempt)
+            time.sleep(retry_interval * attempt)
+            kind = self._test_logging()
 
-        if attempt > max_attempts:
+        if kind is None:
             self._cm.log("ERROR: Cluster logging unrecoverable.")
             return False
 
+        self._cm.env["log_kind"] = kind
         return True
 
     def is_applicable(self):
@@ -203,16 +285,33 @@ class DiskAudit(ClusterAudit):
         ClusterAudit.__init__(self, cm)
         self.name = "DiskspaceAudit"
 
+        # When the last check passed, as a time.monotonic() value
+        self._last_pass = None
+
     def __call__(self):
-        """Perform the audit action."""
+        """
+        Perform the audit action.
+
+        If the audit last passed less than DiskAuditInterval seconds ago, pass
+        again without checking.  A failure is never reused, so that each
+        failed audit logs its reason.
+        """
+        if self._last_pass is not None:
+            elapsed = time.monotonic() - self._last_pass
+
+            if elapsed < self._cm.env["DiskAuditInterval"]:
+                self._cm.debug(f"Skipping {self.name}, last passed {elapsed:.0f}s ago")
+                return True
+
         result = True
 
         # @TODO Use directory of PCMK_logfile if set on host
-        dfcmd = "df -BM %s | tail -1 | awk '{print $(NF-1)\" \"$(NF-2)}' | tr -d 'M%%'" % BuildOptions.LOG_DIR
+        # awk does the work of tail and tr here, so only two processes are needed
+        dfcmd = ("df -BM %s | awk 'END {gsub(/[M%%]/, \"\", $(NF-1)); "
+                 "gsub(/[M%%]/, \"\", $(NF-2)); print $(NF-1), $(NF-2)}'" % BuildOptions.LOG_DIR)
 
         self._cm.ns.wait_for_all_nodes(self._cm.env["nodes"])
-        for node in self._cm.env["nodes"]:
-            (_, dfout) = self._cm.rsh(node, dfcmd, verbose=1)
+        for (node, (_, dfout)) in self._cm.rsh_all(self._cm.env["nodes"], dfcmd).items():
             if not dfout:
                 self._cm.log(f"ERROR: Cannot execute remote df command [{dfcmd}] on {node}")
                 continue
@@ -236,6 +335,11 @@ class DiskAudit(ClusterAudit):
                 elif remaining_mb < 100 or used_percent > 90:
                     self._cm.log(f"WARN: Low on log disk space ({remaining_mb}MB) on {node}")
 
+        if result:
+            self._last_pass = time.monotonic()
+        else:
+            self._last_pass = None
+
         return result
 
     def is_applicable(self):
@@ -260,53 +364,94 @@ class FileAudit(ClusterAudit):
         cm -- A ClusterManager instance
         """
         ClusterAudit.__init__(self, cm)
-        self.known = []
+        self.known = set()
         self.name = "FileAudit"
 
+        # Maps each node whose last check was clean to a tuple of (whether
+        # the node was down, modification times of the checked directories)
+        self._last = {}
+
+    def _node_cmd(self, node):
+        """Return the remote command that checks the file system on a node."""
+        node_down = self._cm.expected_status.get(node) == "down"
+        paths = "/var/lib/pacemaker/cores /var/lib/pacemaker/cores/* /var/lib/corosync"
+
+        if node_down:
+            paths += " /dev/shm"
+
+        # All checks for a node are run in a single remote shell, with the
+        # output of each check preceded by a section marker line.  The first
+        # section holds the modification times of the directories being
+        # checked.  If they match the last clean check, nothing else is run.
+        cmd = (f"mtimes=$(stat -c %y {paths} 2>/dev/null | tr '\\n' ' '); "
+               f"echo {self._SECTION}mtimes; echo \"$mtimes\"; ")
+
+        last = self._last.get(node)
+        if last and last[0] == node_down:
+            cmd += f"[ \"$mtimes\" = '{last[1]}' ] && exit 0; "
+
+        cmd += (f"echo {self._SECTION}pacemaker-cores; "
+                "find /var/lib/pacemaker/cores -mindepth 1 -maxdepth 2 -name 'core.[0-9]*' -ls; "
+                f"echo {self._SECTION}corosync-cores; "
+                "find /var/lib/corosync -mindepth 1 -maxdepth 1 -name 'core.[0-9]*' -ls")
+
+        # If there are stale IPC files, list processes and remove the files
+        if node_down:
+            cmd += (f"; echo {self._SECTION}ipc; ls -al /dev/shm | grep qb- && "
+                    f"{{ echo {self._SECTION}ps; ps axf | grep -e pacemaker -e corosync; "
+                    "rm -rf /dev/shm/qb-*; }")
+
+        return cmd
+
     def __call__(self):
         """Perform the audit action."""
         result = True
 
         self._cm.ns.wait_for_all_nodes(self._cm.env["nodes"])
-        for node in self._cm.env["nodes"]:
+        for (node, (_, lsout)) in self._cm.rsh_all(self._cm.env["nodes"], self._node_cmd).items():
+            node_down = self._cm.expected_status.get(node) == "down"
+            node_result = True
+
+            sections = self._split_sections(lsout)
 
-            (_, lsout) = self._cm.rsh(node, "ls -al /var/lib/pacemaker/cores/* | grep core.[0-9]", verbose=1)
-            for line in lsout:
+            if "mtimes" in sections and "pacemaker-cores" not in sections:
+                self._cm.debug(f"No file system changes on {node} since last check")
+                continue
+
+            for line in sections.get("pacemaker-cores", []):
                 line = line.strip()
 
                 if line not in self.known:
-                    result = False
-                    self.known.append(line)
+                    node_result = False
+                    self.known.add(line)
                     self._cm.log(f"Warning: Pacemaker core file on {node}: {line}")
 
-            (_, lsout) = self._cm.rsh(node, "ls -al /var/lib/corosync | grep core.[0-9]", verbose=1)
-            for line in lsout:
+            for line in sections.get("corosync-cores", []):
                 line = line.strip()
 
                 if line not in self.known:
-                    result = False
-                    self.known.append(line)
+                    node_result = False
+                    self.known.add(line)
                     self._cm.log(f"Warning: Corosync core file on {node}: {line}")
 
-            if self._cm.expected_status.get(node) == "down":
-                clean = False
-                (_, lsout) = self._cm.rsh(node, "ls -al /dev/shm | grep qb-", verbose=1)
-
-                for line in lsout:
-                    result = False
-                    clean = True
+            if node_down:
+                for line in sections.get("ipc", []):
+                    node_result = False
                     self._cm.log(f"Warning: Stale IPC file on {node}: {line}")
 
-                if clean:
-                    (_, lsout) = self._cm.rsh(node, "ps axf | grep -e pacemaker -e corosync", verbose=1)
+                for line in sections.get("ps", []):
+                    self._cm.debug(f"ps[{node}]: {line}")
 
-                    for line in lsout:
-                        self._cm.debug(f"ps[{node}]: {line}")
+            else:
+                self._cm.debug(f"Skipping {node}")
 
-                    self._cm.rsh(node, "rm -rf /dev/shm/qb-*")
+            if not node_result:
+                result = False
 
+            if node_result and sections.get("mtimes"):
+                self._last[node] = (node_down, sections["mtimes"][0].rstrip("\n"))
             else:
-                self._cm.debug(f"Skipping {node}")
+                self._last.pop(node, None)
 
         return result
 
@@ -318,6 +463,11 @@ class FileAudit(ClusterAudit):
 class AuditResource:
     """A base class for storing information about a cluster resource."""
 
+    # There is one instance of this class per resource in the cluster, so
+    # don't give each of them a __dict__
+    __slots__ = ("_cm", "line", "type", "id", "clone_id", "parent", "rprovider",
+                 "rclass", "rtype", "host", "needs_quorum", "flags", "flags_s")
+
     def __init__(self, cm, line):
         """
         Create a new AuditResource instance.
@@ -328,20 +478,13 @@ class AuditResource:
                 resource
         """
         # pylint: disable=invalid-name
-        fields = line.split()
         self._cm = cm
         self.line = line
-        self.type = fields[1]
-        self.id = fields[2]
-        self.clone_id = fields[3]
-        self.parent = fields[4]
-        self.rprovider = fields[5]
-        self.rclass = fields[6]
-        self.rtype = fields[7]
-        self.host = fields[8]
-        self.needs_quorum = fields[9]
-        self.flags = int(fields[10])
-        self.flags_s = fields[11]
+
+        (_, self.type, self.id, self.clone_id, self.parent, self.rprovider,
+         self.rclass, self.rtype, self.host, self.needs_quorum, flags,
+         self.flags_s) = line.rstrip().split(None, 11)
+        self.flags = int(flags)
 
         if self.parent == "NA":
             self.parent = None
@@ -349,22 +492,27 @@ class AuditResource:
     @property
     def unique(self):
         """Return True if this resource is unique."""
-        return self.flags & 0x20
+        return bool(self.flags & _FLAG_UNIQUE)
 
     @property
     def orphan(self):
         """Return True if this resource is an orphan."""
-        return self.flags & 0x01
+        return bool(self.flags & _FLAG_ORPHAN)
 
     @property
     def managed(self):
         """Return True if this resource is managed by the cluster."""
-        return self.flags & 0x02
+        return bool(self.flags & _FLAG_MANAGED)
 
 
 class AuditConstraint:
     """A base class for storing information about a cluster constraint."""
 
+    # There is one instance of this class per constraint in the cluster, so
+    # don't give each of them a __dict__
+    __slots__ = ("_cm", "line", "type", "id", "rsc", "target", "score",
+                 "rsc_role", "target_role")
+
     def __init__(self, cm, line):
         """
         Create a new AuditConstraint instance.
@@ -375,16 +523,11 @@ class AuditConstraint:
                 constraint
         """
         # pylint: disable=invalid-name
-        fields = line.split()
         self._cm = cm
         self.line = line
-        self.type = fields[1]
-        self.id = fields[2]
-        self.rsc = fields[3]
-        self.target = fields[4]
-        self.score = fields[5]
-        self.rsc_role = fields[6]
-        self.target_role = fields[7]
+
+        (_, self.type, self.id, self.rsc, self.target, self.score,
+         self.rsc_role, self.target_role) = line.rstrip().split(None, 7)
 
         if self.rsc_role == "NA":
             self.rsc_role = None
@@ -414,15 +557,28 @@ class PrimitiveAudit(ClusterAudit):
         self.name = "PrimitiveAudit"
 
         self._active_nodes = []
+        self._children_by_parent = defaultdict(list)
         self._constraints = []
         self._inactive_nodes = []
+        self._location_cache = {}
         self._resources = []
         self._target = None
 
+    def _resource_location(self, rsc_id):
+        """
+        Return a list of cluster nodes where a given resource is running.
+
+        Each resource is only looked up once per audit.
+        """
+        if rsc_id not in self._location_cache:
+            self._location_cache[rsc_id] = self._cm.resource_location(rsc_id)
+
+        return self._location_cache[rsc_id]
+
     def _audit_resource(self, resource, quorum):
         """Perform the audit of a single resource."""
         rc = True
-        active = self._cm.resource_location(resource.id)
+        active = self._resource_location(resource.id)
 
         if len(active) == 1:
             if quorum:
@@ -473,16 +629,18 @@ class PrimitiveAudit(ClusterAudit):
 
         Collect resource and colocation information used for performing the audit.
         """
+        # Resource locations may have changed since the last audit
+        self._location_cache = {}
+
         for node in self._cm.env["nodes"]:
             if self._cm.expected_status[node] == "up":
                 self._active_nodes.append(node)
+
+                if self._target is None:
+                    self._target = node
             else:
                 self._inactive_nodes.append(node)
 
-        for node in self._cm.env["nodes"]:
-            if self._target is None and self._cm.expected_status[node] == "up":
-                self._target = node
-
         if not self._target:
             # TODO: In Pacemaker 1.0 clusters we'll be able to run crm_resource
             # with CIB_file=/path/to/cib.xml even when the cluster isn't running
@@ -493,9 +651,11 @@ class PrimitiveAudit(ClusterAudit):
                                   verbose=1)
 
         for line in lines:
-            if re.search("^Resource", line):
-                self._resources.append(AuditResource(self._cm, line))
-            elif re.search("^Constraint", line):
+            if line.startswith("Resource"):
+                resource = AuditResource(self._cm, line)
+                self._resources.append(resource)
+                self._children_by_parent[resource.parent].append(resource)
+            elif line.startswith("Constraint"):
                 self._constraints.append(AuditConstraint(self._cm, line))
             else:
                 self._cm.log(f"Unknown entry: {line}")
@@ -558,11 +718,8 @@ class GroupAudit(PrimitiveAudit):
             first_match = True
             group_location = None
 
-            for child in self._resources:
-                if child.parent != group.id:
-                    continue
-
-                nodes = self._cm.resource_location(child.id)
+            for child in self._children_by_parent.get(group.id, ()):
+                nodes = self._resource_location(child.id)
 
                 if first_match and len(nodes) > 0:
                     group_location = nodes[0]
@@ -616,8 +773,8 @@ class CloneAudit(PrimitiveAudit):
             if clone.type != "clone":
                 continue
 
-            for child in self._resources:
-                if child.parent == clone.id and child.type == "primitive":
+            for child in self._children_by_parent.get(clone.id, ()):
+                if child.type == "primitive":
                     self.debug(f"Checking child {child.id} of {clone.id}...")
                     # Check max and node_max
                     # Obtain with:
@@ -666,12 +823,22 @@ class ColocationAudit(PrimitiveAudit):
         if not self._setup():
             return result
 
+        # Many constraints can refer to the same resource, so only look up
+        # each resource's location once
+        locations = {}
+
+        def location(rsc):
+            if rsc not in locations:
+                locations[rsc] = self._crm_location(rsc)
+
+            return locations[rsc]
+
         for coloc in self._constraints:
             if coloc.type != "rsc_colocation":
                 continue
 
-            source = self._crm_location(coloc.rsc)
-            target = self._crm_location(coloc.target)
+            source = location(coloc.rsc)
+            target = location(coloc.target)
 
             if not source:
                 self.debug(f"Colocation audit ({coloc.id}): {coloc.rsc} not running")
@@ -707,9 +874,11 @@ class ControllerStateAudit(ClusterAudit):
         down_are_up = 0
         unstable_list = []
 
-        for node in self._cm.env["nodes"]:
-            should_be = self._cm.expected_status[node]
-            rc = self._cm.test_node_cm(node)
+        # test_node_cm updates expected_status, so save what it was beforehand
+        expected = {node: self._cm.expected_status[node] for node in self._cm.env["nodes"]}
+
+        for (node, rc) in self._parallel(self._cm.env["nodes"], self._cm.test_node_cm):
+            should_be = expected[node]
 
             if rc > 0:
                 if should_be == "down":
@@ -783,10 +952,30 @@ class CIBAudit(ClusterAudit):
         passed = True
         node0 = None
         node0_xml = None
+        node0_digest = None
 
         partition_hosts = hostlist.split()
-        for node in partition_hosts:
-            node_xml = self._store_remote_cib(node, node0)
+        cib_query = self._cm.templates["CibQuery"]
+
+        # Have each node save its own CIB, rather than passing it through here,
+        # and report a checksum of it
+        def save_cib(node):
+            filename = self._cib_filename(node)
+            return f"{cib_query} > {filename} && sha256sum {filename}"
+
+        for (node, (rc, lines)) in self._cm.rsh_all(partition_hosts, save_cib).items():
+            if rc != 0 or not lines:
+                self._cm.log("Could not retrieve configuration")
+                node_xml = None
+            else:
+                digest = lines[0].split()[0]
+
+                # Identical CIBs don't need to be copied or diffed
+                if node0 is not None and digest == node0_digest:
+                    self.debug(f"CIB on {node} is identical to the one on {node0}")
+                    continue
+
+                node_xml = self._store_remote_cib(node, node0)
 
             if node_xml is None:
                 self._cm.log(f"Could not perform audit: No configuration from {node}")
@@ -795,6 +984,7 @@ class CIBAudit(ClusterAudit):
             elif node0 is None:
                 node0 = node
                 node0_xml = node_xml
+                node0_digest = digest
 
             elif node0_xml is None:
                 self._cm.log(f"Could not perform audit: No configuration from {node0}")
@@ -809,7 +999,7 @@ class CIBAudit(ClusterAudit):
                     passed = False
 
                 for line in result:
-                    if not re.search("<diff/>", line):
+                    if "<diff/>" not in line:
                         passed = False
                         self.debug(f"CibDiff[{node0}-{node}]: {line}")
                     else:
@@ -817,27 +1007,32 @@ class CIBAudit(ClusterAudit):
 
         return passed
 
+    def _cib_filename(self, node):
+        """Return the name of the file the given node's CIB is saved to."""
+        return f"/tmp/ctsaudit.{node}.xml"
+
     def _store_remote_cib(self, node, target):
         """
-        Store a copy of the given node's CIB on the given target node.
+        Store a copy of the given node's saved CIB on the given target node.
 
-        If no target is given, store the CIB on the given node.
-        """
-        filename = f"/tmp/ctsaudit.{node}.xml"
+        If no target is given, or the target is the node itself, the CIB the
+        node saved is used as-is.
 
-        if not target:
-            target = node
+        Arguments:
+        node   -- The node the CIB was retrieved from
+        target -- The node to store the CIB on
+        """
+        filename = self._cib_filename(node)
 
-        (rc, lines) = self._cm.rsh(node, self._cm["CibQuery"], verbose=1)
-        if rc != 0:
-            self._cm.log("Could not retrieve configuration")
-            return None
+        if not target or target == node:
+            return filename
 
-        self._cm.rsh("localhost", f"rm -f {filename}")
-        for line in lines:
-            self._cm.rsh("localhost", f"echo \'{line[:-1]}\' >> {filename}", verbose=0)
+        # Copy the file by way of this host, using a different local name in
+        # case this host is also a cluster node
+        local = f"{filename}.local"
 
-        if self._cm.rsh.copy(filename, f"root@{target}:{filename}", silent=True) != 0:
+        if self._cm.rsh.copy(f"root@{node}:{filename}", local, silent=True) != 0 \
+           or self._cm.rsh.copy(local, f"root@{target}:{filename}", silent=True) != 0:
             self._cm.log("Could not store configuration")
             return None
 
@@ -915,22 +1110,57 @@ class PartitionAudit(ClusterAudit):
         return avalue
 
     def _trim2int(self, avalue):
-        """Remove the last character from a multi-character string and convert the result to an int."""
-        trimmed = self._trim_string(avalue)
-        if trimmed:
-            return int(trimmed)
+        """Return a line of command output as an int, or None if it is not one."""
+        if not avalue:
+            return None
+
+        avalue = avalue.strip()
+
+        # Anything else, such as an error message, is not an epoch
+        if _INT_RE.fullmatch(avalue):
+            return int(avalue)
 
         return None
 
+    def _query_template(self):
+        """
+        Return the command that runs the status, epoch, and quorum queries.
+
+        All three queries are run in a single remote shell, each in its own
+        section of the output.  The node name still needs to be substituted
+        into the result.
+        """
+        queries = [("status", "StatusCmd"), ("epoch", "EpochCmd"), ("quorum", "QuorumCmd")]
+        return "; ".join(f"echo {self._SECTION}{section}; {self._cm.templates[key]}"
+                         for (section, key) in queries)
+
+    def _query_node(self, node, template):
+        """
+        Return the first line of status, epoch, and quorum output from a node.
+
+        An empty string is returned for any query that produced no output.
+
+        Arguments:
+        node     -- The node to query
+        template -- The command returned by _query_template()
+        """
+        (_, out) = self._cm.rsh(node, template % node, verbose=1)
+
+        # Lines are kept as-is, trailing newline and all, because
+        # _trim_string() expects to remove it
+        sections = self._split_sections(out)
+
+        return tuple(sections[section][0] if sections.get(section) else ""
+                     for section in ["status", "epoch", "quorum"])
+
     def _audit_partition(self, partition):
         """Perform the audit of a single partition."""
         passed = True
         dc_found = []
         dc_allowed_list = []
-        lowest_epoch = None
         node_list = partition.split()
 
-        self.debug(f"Auditing partition: {partition}")
+        self.debug("Auditing partition: %s", partition)
         for node in node_list:
             if self._cm.expected_status[node] != "up":
                 self._cm.log(f"Warn: Node {node} appeared out of nowhere")
@@ -938,27 +1168,30 @@ class PartitionAudit(ClusterAudit):
                 # not in itself a reason to fail the audit (not what we're
                 #  checking for in this audit)
 
-            (_, out) = self._cm.rsh(node, self._cm["StatusCmd"] % node, verbose=1)
-            self._node_state[node] = out[0].strip()
-
-            (_, out) = self._cm.rsh(node, self._cm["EpochCmd"], verbose=1)
-            self._node_epoch[node] = out[0].strip()
+        # Query all nodes at once, but handle the results in partition order
+        template = self._query_template()
+        results = dict(self._parallel(node_list,
+                                      lambda node: self._query_node(node, template)))
 
-            (_, out) = self._cm.rsh(node, self._cm["QuorumCmd"], verbose=1)
-            self._node_quorum[node] = out[0].strip()
+        self._node_state.update({node: self._trim_string(state)
+                                 for (node, (state, _, _)) in results.items()})
+        self._node_epoch.update({node: self._trim2int(epoch)
+                                 for (node, (_, epoch, _)) in results.items()})
+        self._node_quorum.update({node: self._trim_string(quorum)
+                                  for (node, (_, _, quorum)) in results.items()})
 
-            self.debug(f"Node {node}: {self._node_state[node]} - {self._node_epoch[node]} - {self._node_quorum[node]}.")
-            self._node_state[node] = self._trim_string(self._node_state[node])
-            self._node_epoch[node] = self._trim2int(self._node_epoch[node])
-            self._node_quorum[node] = self._trim_string(self._node_quorum[node])
+        for node in results:
+            self.debug("Node %s: %s - %s - %s.", node, self._node_state[node],
+                       self._node_epoch[node], self._node_quorum[node])
 
             if not self._node_epoch[node]:
                 self._cm.log(f"Warn: Node {node} disappeared: can't determine epoch")
                 self._cm.expected_status[node] = "down"
                 # not in itself a reason to fail the audit (not what we're
                 #  checking for in this audit)
-            elif lowest_epoch is None or self._node_epoch[node] < lowest_epoch:
-                lowest_epoch = self._node_epoch[node]
+
+        lowest_epoch = min((self._node_epoch[node] for node in results if self._node_epoch[node]),
+                           default=None)
 
         if not lowest_epoch:
             self._cm.log(f"Lowest epoch not determined in {partition}")
@@ -968,14 +1201,22 @@ class PartitionAudit(ClusterAudit):
             if self._cm.expected_status[node] != "up":
                 continue
 
-            if self._cm.is_node_dc(node, self._node_state[node]):
+            # The status of every node was already queried above.  If that
+            # gave nothing, don't let is_node_dc() query it again.
+            if self._node_state[node] and self._cm.is_node_dc(node, self._node_state[node]):
                 dc_found.append(node)
+
+                # More than one DC already fails the audit, so only keep
+                # collecting DCs to report them
+                if len(dc_found) > 1:
+                    continue
+
                 if self._node_epoch[node] == lowest_epoch:
-                    self.debug(f"{node}: OK")
+                    self.debug("%s: OK", node)
                 elif not self._node_epoch[node]:
-                    self.debug(f"Check on {node} ignored: no node epoch")
+                    self.debug("Check on %s ignored: no node epoch", node)
                 elif not lowest_epoch:
-                    self.debug(f"Check on {node} ignored: no lowest epoch")
+                    self.debug("Check on %s ignored: no lowest epoch", node)
                 else:
                     self._cm.log(f"DC {node} is not the oldest node "
                                  f"({self._node_epoch[node]} vs. {lowest_epoch})")
@@ -1010,13 +1251,8 @@ class PartitionAudit(ClusterAudit):
 # pylint: disable=invalid-name
 def audit_list(cm):
     """Return a list of instances of applicable audits that can be performed."""
-    result = []
-
-    for auditclass in [DiskAudit, FileAudit, LogAudit, ControllerStateAudit,
-                       PartitionAudit, PrimitiveAudit, GroupAudit, CloneAudit,
-                       ColocationAudit, CIBAudit]:
-        a = auditclass(cm)
-        if a.is_applicable():
-            result.append(a)
+    classes = (DiskAudit, FileAudit, LogAudit, ControllerStateAudit,
+               PartitionAudit, PrimitiveAudit, GroupAudit, CloneAudit,
+               ColocationAudit, CIBAudit)
 
-    return result
+    return [a for a in (auditclass(cm) for auditclass in classes) if a.is_applicable()]
@@ -12,6 +12,7 @@ import re
 import time
 
 from collections import UserDict
+from concurrent.futures import ThreadPoolExecutor
 
 from pacemaker.buildoptions import BuildOptions
 from pacemaker.exitstatus import ExitStatus
@@ -134,9 +135,40 @@ class ClusterManager(UserDict):
         """Log a message."""
         self._logger.log(args)
 
-    def debug(self, args):
-        """Log a debug message."""
-        self._logger.debug(args)
+    def debug(self, args, *fmt_args):
+        """Log a debug message, with optional %-style arguments (see LogFactory.debug)."""
+        self._logger.debug(args, *fmt_args)
+
+    @property
+    def rsh_fanout(self):
+        """Return the maximum number of remote commands to run at once by default."""
+        return self.env["RemoteFanout"]
+
+    def rsh_all(self, nodes, cmd, max_workers=None):
+        """
+        Run a command on each of the given nodes, all at the same time.
+
+        Arguments:
+        nodes       -- The nodes to run on
+        cmd         -- The command to run, or a function that takes a node and
+                       returns the command to run on it
+        max_workers -- The maximum number of commands to run at once, or None
+                       to use rsh_fanout
+
+        Returns a dict mapping each node, in the order the nodes were given, to
+        a (return code, command output) tuple.
+        """
+        # Build the commands here rather than in the worker threads
+        if callable(cmd):
+            cmds = {node: cmd(node) for node in nodes}
+        else:
+            cmds = {node: cmd for node in nodes}
+
+        with ThreadPoolExecutor(max_workers=max_workers or self.rsh_fanout) as executor:
+            futures = {node: executor.submit(self.rsh, node, cmds[node], verbose=1)
+                       for node in nodes}
+
+            return {node: future.result() for (node, future) in futures.items()}
 
     def upcount(self):
         """Return how many nodes are up."""
@@ -860,15 +892,14 @@ class ClusterManager(UserDict):
 
         Return whether the node is now in the requested status.
         """
-        current_status = self.in_standby_mode(node)
-
-        if current_status == status:
-            return True
+        query = self.templates["StandbyQueryCmd"] % node
 
+        # Check the current status and change it if needed in a single remote
+        # shell, treating anything but "on" as active like in_standby_mode()
         if status:
-            cmd = self.templates["StandbyCmd"] % (node, "on")
+            cmd = f'[ "$({query})" = on ] || {self.templates["StandbyCmd"] % (node, "on")}'
         else:
-            cmd = self.templates["StandbyCmd"] % (node, "off")
+            cmd = f'[ "$({query})" != on ] || {self.templates["StandbyCmd"] % (node, "off")}'
 
         (rc, _) = self.rsh(node, cmd)
         return rc == 0
@@ -66,6 +66,14 @@ class Environment:
         self["node-limit"] = 0
         self["scenario"] = "random"
 
+        # Base number of seconds LogAudit waits after restarting logging
+        self["LogAuditRetrySeconds"] = 10
+        # Seconds for which a passed disk space audit is reused
+        self["DiskAuditInterval"] = 60
+
+        # Maximum number of remote commands run at once by default
+        self["RemoteFanout"] = 16
+
         self.random_gen = random.Random()
 
         self._logger = LogFactory()
@@ -301,6 +309,25 @@ class Environment:
         if not self["nodes"]:
             raise ValueError("No nodes specified!")
 
+        self._validate_int("DiskAuditInterval", 0)
+        self._validate_int("LogAuditRetrySeconds", 0)
+        self._validate_int("RemoteFanout", 1)
+
+    def _validate_int(self, key, minimum):
+        """
+        Check that the given key has an integer value of at least minimum.
+
+        Values given with --set are strings, so the value is also converted
+        to an int, letting callers use it directly.
+        """
+        try:
+            self[key] = int(self[key])
+        except ValueError as e:
+            raise ValueError(f"{key} must be an integer, not {self[key]!r}") from e
+
+        if self[key] < minimum:
+            raise ValueError(f"{key} must be at least {minimum}")
+
     def _discover(self):
         """Probe cluster nodes to figure out how to log and manage services."""
         self._target = random.Random().choice(self["nodes"])
@@ -106,11 +106,27 @@ class LogFactory:
         for logfn in LogFactory.log_methods:
             logfn(args.strip())
 
-    def debug(self, args):
-        """Log a debug message (to all configured log destinations)."""
-        for logfn in LogFactory.log_methods:
-            if logfn.is_debug_target:
-                logfn(f"debug: {args.strip()}")
+    def debug(self, args, *fmt_args):
+        """
+        Log a debug message (to all configured log destinations).
+
+        Arguments:
+        args     -- The message to log
+        fmt_args -- If given, values to substitute into %-style placeholders
+                    in the message.  This is only done if the message will
+                    actually be logged somewhere, so debug messages in busy
+                    loops cost little when nothing logs them.
+        """
+        targets = [logfn for logfn in LogFactory.log_methods if logfn.is_debug_target]
+
+        if not targets:
+            return
+
+        if fmt_args:
+            args = args % fmt_args
+
+        for logfn in targets:
+            logfn(f"debug: {args.strip()}")
 
     def traceback(self, traceback):
         """Log a stack trace (to all configured log destinations)."""
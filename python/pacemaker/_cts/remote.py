@@ -4,10 +4,13 @@ __all__ = ["RemoteExec", "RemoteFactory"]
 __copyright__ = "Copyright 2014-2025 the Pacemaker project contributors"
 __license__ = "GNU General Public License version 2 or later (GPLv2+) WITHOUT ANY WARRANTY"
 
+import atexit
 import re
 import os
+import shutil
+import tempfile
 
-from subprocess import Popen, PIPE
+from subprocess import DEVNULL, Popen, PIPE
 from threading import Thread
 
 from pacemaker._cts.logging import LogFactory
@@ -102,21 +105,27 @@ class RemoteExec:
     It runs a command on another machine using ssh and scp.
     """
 
-    def __init__(self, command, cp_command, silent=False):
+    def __init__(self, command, cp_command, silent=False, close_command=None):
         """
         Create a new RemoteExec instance.
 
         Arguments:
-        command    -- The ssh command string to use for remote execution
-        cp_command -- The scp command string to use for copying files
-        silent     -- Should we log command status?
+        command       -- The ssh command string to use for remote execution
+        cp_command    -- The scp command string to use for copying files
+        silent        -- Should we log command status?
+        close_command -- If not None, the ssh command string to use for closing
+                         the shared connection to a remote machine
         """
+        self._close_command = close_command
         self._command = command
         self._cp_command = cp_command
         self._logger = LogFactory()
         self._silent = silent
         self._our_node = os.uname()[1].lower()
 
+        # Remote machines we may have a shared connection open to
+        self._connected = set()
+
     def _fixcmd(self, cmd):
         """Perform shell escapes on certain characters in the input cmd string."""
         return re.sub("\'", "'\\''", cmd)
@@ -130,6 +139,7 @@ class RemoteExec:
             ret = command
         else:
             ret = f"{self._command} {sysname} '{self._fixcmd(command)}'"
+            self._connected.add(sysname)
 
         return ret
 
@@ -213,6 +223,40 @@ class RemoteExec:
 
         return (rc, result)
 
+    def iter_lines(self, node, command, verbose=1):
+        """
+        Run the given command on the given remote system, yielding its output.
+
+        Each line of output is yielded as soon as it is read, so callers looking
+        for a single line don't have to wait for or store the rest.  If the
+        caller stops iterating early, the command is terminated.  Unlike
+        __call__, the command's stderr is discarded.
+
+        Arguments:
+        node    -- The remote machine to run on
+        command -- The command to run, as a string
+        verbose -- If 0, do not log anything.  Otherwise, log the command and
+                   its return code.
+        """
+        # pylint: disable=consider-using-with
+        proc = Popen(self._cmd([node, command]),
+                     stdout=PIPE, stderr=DEVNULL, close_fds=True, shell=True)
+
+        try:
+            for line in proc.stdout:
+                yield convert2string(line)
+
+        finally:
+            proc.stdout.close()
+
+            if proc.poll() is None:
+                proc.terminate()
+
+            rc = proc.wait()
+
+            if verbose > 0:
+                self._debug(f"cmd: target={node}, rc={rc}: {command}")
+
     def copy(self, source, target, silent=False):
         """
         Perform a copy of the source file to the remote target.
@@ -232,6 +276,29 @@ class RemoteExec:
 
         return rc
 
+    def close(self, node=None):
+        """
+        Close the shared connection to the given remote system, or to all.
+
+        Connections are opened again as needed, so this is always safe to call.
+        """
+        if not self._close_command:
+            return
+
+        if node is None:
+            nodes = sorted(self._connected)
+        else:
+            nodes = [node]
+
+        for host in nodes:
+            self._connected.discard(host)
+
+            with Popen(f"{self._close_command} {host}", stdout=PIPE, stderr=PIPE,
+                       close_fds=True, shell=True) as proc:
+                rc = proc.wait()
+
+            self._debug(f"cmd: closed connection to {host}: rc={rc}")
+
     def exists_on_all(self, filename, hosts):
         """Return True if specified file exists on all specified hosts."""
         for host in hosts:
@@ -257,8 +324,32 @@ class RemoteFactory:
     # -B: batch mode, -q: no stats (quiet)
     cp_command = "scp -B -q"
 
+    # -O exit: tell the shared connection to a node to exit.  If None, the
+    # remote shell does not share connections.
+    close_command = "ssh -l root -O exit"
+
     instance = None
 
+    @staticmethod
+    def _mux_options():
+        """
+        Return ssh options for sharing one connection per node.
+
+        All ssh and scp commands run on a node then share one connection,
+        rather than authenticating again every time.  The first command run on
+        a node opens the connection, which stays open for up to 10 minutes of
+        idle time.
+
+        The control sockets go in a new directory that only we can write to,
+        so no other local user can create a socket there first.  %C is a hash
+        of the connection details, which keeps the socket path short.
+        """
+        control_dir = tempfile.mkdtemp(prefix="cts-ssh-")
+        atexit.register(shutil.rmtree, control_dir, ignore_errors=True)
+
+        return (f"-o ControlMaster=auto -o ControlPath={control_dir}/%C "
+                "-o ControlPersist=600")
+
     # pylint: disable=invalid-name
     def getInstance(self):
         """
@@ -267,9 +358,18 @@ class RemoteFactory:
         If no instance exists, create one and then return that.
         """
         if not RemoteFactory.instance:
-            RemoteFactory.instance = RemoteExec(RemoteFactory.command,
-                                                RemoteFactory.cp_command,
-                                                False)
+            command = RemoteFactory.command
+            cp_command = RemoteFactory.cp_command
+            close_command = RemoteFactory.close_command
+
+            if close_command:
+                mux_options = self._mux_options()
+                command = f"{command}{mux_options} "
+                cp_command = f"{cp_command} {mux_options}"
+                close_command = f"{close_command} {mux_options}"
+
+            RemoteFactory.instance = RemoteExec(command, cp_command, False,
+                                                close_command)
         return RemoteFactory.instance
 
     def enable_qarsh(self):
@@ -279,3 +379,4 @@ class RemoteFactory:
 
         RemoteFactory.command = "qarsh -t 300 -l root"
         RemoteFactory.cp_command = "qacp -q"
+        RemoteFactory.close_command = None
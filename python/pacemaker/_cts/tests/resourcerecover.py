@@ -3,6 +3,8 @@
 __copyright__ = "Copyright 2000-2025 the Pacemaker project contributors"
 __license__ = "GNU General Public License version 2 or later (GPLv2+) WITHOUT ANY WARRANTY"
 
+import re
+
 from pacemaker._cts.audits import AuditResource
 from pacemaker._cts.tests.ctstest import CTSTest
 from pacemaker._cts.tests.simulstartlite import SimulStartLite
@@ -17,6 +19,12 @@ from pacemaker._cts.timer import Timer
 # pylint doesn't understand that self._rsh is callable.
 # pylint: disable=not-callable
 
+# Matches a resource line of crm_resource -c output, capturing the resource ID
+_RESOURCE_LINE_RE = re.compile(r"^Resource:\s+\S+\s+(\S+)")
+
+# Matches the output of a successful fail count query
+_FAILCOUNT_RE = re.compile(r"-?\d+")
+
 
 class ResourceRecover(CTSTest):
     """Fail a random resource."""
@@ -91,48 +99,63 @@ class ResourceRecover(CTSTest):
         """Choose a random resource to target."""
         self._rid = self._env.random_gen.choice(resourcelist)
         self._rid_alt = self._rid
-        (_, lines) = self._rsh(node, "crm_resource -c", verbose=1)
+        # Stop reading as soon as the chosen resource is found
+        for line in self._rsh.iter_lines(node, "crm_resource -c"):
+            # Only parse the line for the chosen resource
+            match = _RESOURCE_LINE_RE.match(line)
 
-        for line in lines:
-            if line.startswith("Resource: "):
+            if match and match.group(1) == self._rid:
                 rsc = AuditResource(self._cm, line)
 
-                if rsc.id == self._rid:
-                    # Handle anonymous clones that get renamed
-                    self._rid = rsc.clone_id
-                    return rsc
+                # Handle anonymous clones that get renamed
+                self._rid = rsc.clone_id
+                return rsc
 
         return None
 
+    def _failcount_cmd(self, node):
+        """Return the command for querying the fail count of the targeted resource on the given node."""
+        cmd = "crm_failcount --quiet --query --resource %s --operation %s --interval %d --node %s"
+        return cmd % (self._rid, self._action, self._interval, node)
+
     def _get_failcount(self, node):
         """Check the fail count of targeted resource on given node."""
-        cmd = "crm_failcount --quiet --query --resource %s --operation %s --interval %d --node %s"
-        (rc, lines) = self._rsh(node, cmd % (self._rid, self._action, self._interval, node),
-                                verbose=1)
+        return self._parse_failcount(node, self._rsh(node, self._failcount_cmd(node), verbose=1))
 
-        if rc != 0 or len(lines) != 1:
-            lines = [line.strip() for line in lines]
-            s = " // ".join(lines)
+    def _parse_failcount(self, node, result):
+        """
+        Return the fail count from the result of the fail count query, or -1 on error.
+
+        Arguments:
+        node   -- The node the fail count was queried on
+        result -- A tuple of (return code, command output) for the query
+        """
+        (rc, lines) = result
+
+        if rc != 0:
+            s = " // ".join(line.strip() for line in lines)
             self._logger.log(f"crm_failcount on {node} failed ({rc}): {s}")
             return -1
 
-        try:
-            failcount = int(lines[0])
-        except (IndexError, ValueError):
-            s = " ".join(lines)
-            self._logger.log(f"crm_failcount output on {node} unparseable: {s}")
+        # No output at all means there have been no failures
+        raw = lines[0].strip() if lines else "0"
+
+        if not _FAILCOUNT_RE.fullmatch(raw):
+            self._logger.log(f"crm_failcount output on {node} unparseable: {raw}")
             return -1
 
-        return failcount
+        return int(raw)
 
     def _fail_resource(self, rsc, node, pats):
         """Fail the targeted resource, and verify as expected."""
-        orig_failcount = self._get_failcount(node)
-
         watch = self.create_watch(pats, 60)
         watch.set_watch()
 
-        self._rsh(node, f"crm_resource -V -F -r {self._rid} -H {node} &>/dev/null")
+        # Get the original fail count and fail the resource in a single remote
+        # shell, which exits with the status of the fail count query
+        cmd = f"{self._failcount_cmd(node)}; rc=$?; " \
+              f"crm_resource -V -F -r {self._rid} -H {node} &>/dev/null; exit $rc"
+        orig_failcount = self._parse_failcount(node, self._rsh(node, cmd, verbose=1))
 
         with Timer(self._logger, self.name, "recover"):
             watch.look_for_all()
@@ -49,9 +49,8 @@ class StandbyTest(CTSTest):
             return self.failure("Start all nodes failed")
 
         self.debug(f"Make sure node {node} is active")
-        if self._cm.in_standby_mode(node):
-            if not self._cm.set_standby_mode(node, False):
-                return self.failure(f"can't set node {node} to active mode")
+        if not self._cm.set_standby_mode(node, False):
+            return self.failure(f"can't set node {node} to active mode")
 
         self._cm.cluster_stable()
 
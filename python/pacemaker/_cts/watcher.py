@@ -6,6 +6,7 @@ __license__ = "GNU General Public License version 2 or later (GPLv2+) WITHOUT AN
 
 from enum import Enum, auto, unique
 import re
+import shlex
 import time
 import threading
 
@@ -49,6 +50,115 @@ except ImportError:
 
 CTS_SUPPORT_BIN = f"{BuildOptions.DAEMON_DIR}/cts-support"
 
+# Characters that can follow a backslash and mean the same thing to Python and
+# to GNU grep -E
+_GREP_SAFE_ESCAPES = frozenset("sSwWb.[](){}*+?|^$\\")
+
+
+def _grep_regex(regex):
+    r"""
+    Translate a Python regex into one for grep -E that matches the same lines.
+
+    Lines are compared without their trailing newline, as grep sees them (see
+    FileObj.async_complete), so a regex can't match by using the newline.
+
+    This is deliberately conservative.  None is returned for anything grep
+    could treat differently: extension groups, interval expressions, unknown
+    escapes, and escapes or nested brackets inside a bracket expression.
+    Escaped punctuation that is only a literal in Python (such as \>, which
+    is a word boundary to GNU grep) is passed on unescaped.
+    """
+    if "(?" in regex or "{" in regex.replace("\\{", ""):
+        return None
+
+    result = []
+    in_bracket = False
+    i = 0
+
+    while i < len(regex):
+        c = regex[i]
+
+        if c == "\\":
+            escaped = regex[i + 1:i + 2]
+
+            if in_bracket or not escaped:
+                return None
+
+            if escaped in _GREP_SAFE_ESCAPES:
+                result.append(regex[i:i + 2])
+            elif escaped.isalnum():
+                return None
+            else:
+                result.append(escaped)
+
+            i += 2
+            continue
+
+        if in_bracket:
+            if c == "[":
+                return None
+
+            if c == "]":
+                in_bracket = False
+
+        elif c == "[":
+            in_bracket = True
+
+            # A ] right after the opening [ or [^ is a literal
+            if regex[i + 1:i + 2] == "^":
+                result.append(c)
+                i += 1
+                c = "^"
+
+            if regex[i + 1:i + 2] == "]":
+                result.append(c)
+                i += 1
+                c = "]"
+
+        result.append(c)
+        i += 1
+
+    if in_bracket:
+        return None
+
+    return "".join(result)
+
+
+def _grep_filter(regexes, keep):
+    """
+    Return a shell pipeline stage that drops log lines no regex can match.
+
+    This lets log lines be filtered on the node they are read from, rather than
+    sending every line back to be checked here.
+
+    Arguments:
+    regexes -- The regexes (as strings or compiled patterns) being looked for
+    keep    -- A regex for control lines that must always be kept
+
+    Returns an empty string if there is nothing to look for, or if any of the
+    regexes can't safely be given to grep.
+    """
+    patterns = []
+
+    for regex in regexes:
+        if isinstance(regex, re.Pattern):
+            # grep can't be given flags such as re.IGNORECASE
+            if regex.flags & ~re.UNICODE:
+                return ""
+
+            regex = regex.pattern
+
+        patterns.append(_grep_regex(regex))
+
+    if not patterns or None in patterns:
+        return ""
+
+    # Log lines are decoded as UTF-8 here, so have grep match characters the
+    # same way, whatever the locale on the host.  -a keeps grep from treating
+    # the log as binary and printing a notice instead of the lines.
+    args = " ".join(f"-e {shlex.quote(p)}" for p in [keep] + patterns)
+    return f" | LC_ALL=C.UTF-8 grep -a -E {args}"
+
 
 @unique
 class LogKind(Enum):
@@ -70,7 +180,11 @@ class SearchObj:
     Log-specific watchers need to be built on top of this one.
     """
 
-    def __init__(self, filename, host=None, name=None):
+    # A regex matching control lines in the output of harvest commands, which
+    # must never be filtered out
+    _control_regex = None
+
+    def __init__(self, filename, host=None, name=None, regexes=None):
         """
         Create a new SearchObj instance.
 
@@ -78,6 +192,8 @@ class SearchObj:
         filename -- The log to watch
         host     -- The cluster node on which to watch the log
         name     -- A unique name to use when logging about this watch
+        regexes  -- If given, the regexes that will be looked for, so that
+                    other lines can be filtered out on the host
         """
         self.filename = filename
         self.limit = None
@@ -93,6 +209,12 @@ class SearchObj:
 
         self._cache = []
         self._delegate = None
+        self._filter = _grep_filter(regexes or [], self._control_regex)
+
+        # Whether the last harvest got any further through the log.  Every line
+        # it read may have been filtered out on the host, so this can be True
+        # even when no lines came back.
+        self.advanced = False
 
         async_task = self.harvest_async()
         async_task.join()
@@ -142,7 +264,9 @@ class SearchObj:
 class FileObj(SearchObj):
     """A specialized SearchObj subclass for watching log files."""
 
-    def __init__(self, filename, host=None, name=None):
+    _control_regex = "^CTSwatcher:"
+
+    def __init__(self, filename, host=None, name=None, regexes=None):
         """
         Create a new FileObj instance.
 
@@ -150,8 +274,10 @@ class FileObj(SearchObj):
         filename -- The file to watch
         host     -- The cluster node on which to watch the file
         name     -- A unique name to use when logging about this watch
+        regexes  -- If given, the regexes that will be looked for, so that
+                    other lines can be filtered out on the host
         """
-        SearchObj.__init__(self, filename, host, name)
+        SearchObj.__init__(self, filename, host, name, regexes)
 
     def async_complete(self, pid, returncode, out, err):
         """
@@ -168,6 +294,8 @@ class FileObj(SearchObj):
         err         -- stderr from the file read
         """
         messages = []
+        old_offset = self.offset
+
         for line in out:
             match = re.search(r"^CTSwatcher:Last read: (\d+)", line)
 
@@ -179,7 +307,11 @@ class FileObj(SearchObj):
             elif re.search(r"^CTSwatcher:", line):
                 self.debug(f"Got control line: {line}")
             else:
-                messages.append(line)
+                # Drop the newline, which grep doesn't see either, so that
+                # no regex can match differently here than on the host
+                messages.append(line.rstrip("\n"))
+
+        self.advanced = self.offset != old_offset
 
         if self._delegate:
             self._delegate.async_complete(pid, returncode, messages, err)
@@ -195,13 +327,15 @@ class FileObj(SearchObj):
         self._delegate = delegate
 
         if self.limit and (self.offset == "EOF" or int(self.offset) > self.limit):
+            self.advanced = False
+
             if self._delegate:
                 self._delegate.async_complete(-1, -1, [], [])
 
             return None
 
         cmd = f"{CTS_SUPPORT_BIN} watch -p CTSwatcher: -l 200 -f {self.filename} -o {self.offset}"
-        return self.rsh.call_async(self.host, cmd, delegate=self)
+        return self.rsh.call_async(self.host, cmd + self._filter, delegate=self)
 
     def harvest_cached(self):
         """Return cached logs from before the limit timestamp."""
@@ -234,15 +368,19 @@ class FileObj(SearchObj):
 class JournalObj(SearchObj):
     """A specialized SearchObj subclass for watching systemd journals."""
 
-    def __init__(self, host=None, name=None):
+    _control_regex = "^-- cursor: "
+
+    def __init__(self, host=None, name=None, regexes=None):
         """
         Create a new JournalObj instance.
 
         Arguments:
         host     -- The cluster node on which to watch the journal
         name     -- A unique name to use when logging about this watch
+        regexes  -- If given, the regexes that will be looked for, so that
+                    other lines can be filtered out on the host
         """
-        SearchObj.__init__(self, "journal", host, name)
+        SearchObj.__init__(self, "journal", host, name, regexes)
         self._parser = isoparser()
 
     def _msg_after_limit(self, msg):
@@ -303,6 +441,8 @@ class JournalObj(SearchObj):
         out         -- stdout from the journal read
         err         -- stderr from the journal read
         """
+        old_offset = self.offset
+
         if out:
             # Cursor should always be last line of journalctl output
             out, cursor_line = out[:-1], out[-1]
@@ -313,11 +453,17 @@ class JournalObj(SearchObj):
             self.offset = match.group(1).strip()
             self.debug(f"Got new cursor: {self.offset}")
 
+            # Drop the newlines, as FileObj does
+            out = [line.rstrip("\n") for line in out]
+
         before, after = self._split_msgs_by_limit(out)
 
         # Save remaining messages after limit for later processing
         self._cache.extend(after)
 
+        # Reading on past the limit doesn't count
+        self.advanced = self.offset != old_offset and not after
+
         if self._delegate:
             self._delegate.async_complete(pid, returncode, before, err)
 
@@ -339,7 +485,7 @@ class JournalObj(SearchObj):
         else:
             command += f" --after-cursor='{self.offset}' --lines=200"
 
-        return self.rsh.call_async(self.host, command, delegate=self)
+        return self.rsh.call_async(self.host, command + self._filter, delegate=self)
 
     def harvest_cached(self):
         """Return cached logs from before the limit timestamp."""
@@ -434,16 +580,18 @@ class LogWatcher:
 
     def set_watch(self):
         """Mark the place to start watching the log from."""
+        # Regexes are only ever removed from self.regexes after this point, so
+        # lines matching none of them can be dropped where they are read
         if self.kind == LogKind.LOCAL_FILE:
-            self._file_list.append(FileObj(self.filename))
+            self._file_list.append(FileObj(self.filename, regexes=self.regexes))
 
         elif self.kind == LogKind.REMOTE_FILE:
             for node in self.hosts:
-                self._file_list.append(FileObj(self.filename, node, self.name))
+                self._file_list.append(FileObj(self.filename, node, self.name, self.regexes))
 
         elif self.kind == LogKind.JOURNAL:
             for node in self.hosts:
-                self._file_list.append(JournalObj(node, self.name))
+                self._file_list.append(JournalObj(node, self.name, self.regexes))
 
     def async_complete(self, pid, returncode, out, err):
         """
@@ -470,11 +618,17 @@ class LogWatcher:
                 self._line_cache.extend(out)
 
     def __get_lines(self):
-        """Iterate over all watched log files and collect new lines from each."""
+        """
+        Iterate over all watched log files and collect new lines from each.
+
+        Returns True if any log was read further, even if no lines were
+        collected because they were all filtered out on their hosts.
+        """
         if not self._file_list:
             raise ValueError("No sources to read from")
 
         pending = []
+        harvested = []
 
         for f in self._file_list:
             cached = f.harvest_cached()
@@ -486,12 +640,15 @@ class LogWatcher:
                 t = f.harvest_async(self)
                 if t:
                     pending.append(t)
+                    harvested.append(f)
 
         for t in pending:
             t.join(60.0)
             if t.is_alive():
                 self._logger.log(f"{self.name}: Aborting after 20s waiting for {t!r} logging commands")
-                return
+                return False
+
+        return any(f.advanced for f in harvested)
 
     def end(self):
         """
@@ -562,14 +719,23 @@ class LogWatcher:
                     f.set_end()
 
             else:
-                self.__get_lines()
+                advanced = self.__get_lines()
+
+                # Check any new lines right away.  If there were none but a log
+                # was still read further, there may be more to read, so keep
+                # going.  Only wait once all logs have been read to the end
+                # (but never past the end of the search).
+                if self._line_cache or advanced:
+                    continue
+
+                now = time.time()
 
-                if not self._line_cache and end < time.time():
-                    self._debug(f"Single search terminated: start={begin}, end={end}, now={time.time()}, lines={lines}")
+                if end < now:
+                    self._debug(f"Single search terminated: start={begin}, end={end}, now={now}, lines={lines}")
                     return None
 
-                self._debug(f"Waiting: start={begin}, end={end}, now={time.time()}, lines={len(self._line_cache)}")
-                time.sleep(1)
+                self._debug(f"Waiting: start={begin}, end={end}, now={now}, lines={len(self._line_cache)}")
+                time.sleep(min(1, end - now))
 
     def look_for_all(self, allow_multiple_matches=False, silent=False):
         """
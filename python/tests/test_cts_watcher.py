@@ -0,0 +1,96 @@
+# These warnings are not useful in unit tests.
+# pylint: disable=missing-class-docstring,missing-function-docstring,missing-module-docstring
+
+__copyright__ = "Copyright 2025 the Pacemaker project contributors"
+__license__ = "GPLv2+"
+
+import re
+import shutil
+import subprocess
+import unittest
+import unittest.mock
+
+from pacemaker._cts.patterns import PatternSelector
+from pacemaker._cts.watcher import FileObj, _grep_filter, _grep_regex
+
+
+class GrepRegexTestCase(unittest.TestCase):
+    def test_plain(self):
+        self.assertEqual(_grep_regex("Updating failcount for rsc"),
+                         "Updating failcount for rsc")
+        self.assertEqual(_grep_regex(r"(ERROR|error).*: Action \S+ initiated"),
+                         r"(ERROR|error).*: Action \S+ initiated")
+
+    def test_escapes(self):
+        # Escapes that mean the same thing to both are kept
+        self.assertEqual(_grep_regex(r"a\s+b\.c\(d\)"), r"a\s+b\.c\(d\)")
+
+        # Escaped punctuation that is only a literal in Python is unescaped
+        self.assertEqual(_grep_regex(r"a\>b\<c\:"), "a>b<c:")
+
+        # Escapes grep doesn't share are refused
+        self.assertIsNone(_grep_regex(r"\d+"))
+        self.assertIsNone(_grep_regex(r"\A"))
+        self.assertIsNone(_grep_regex("trailing\\"))
+
+    def test_brackets(self):
+        self.assertEqual(_grep_regex("[a-z]+"), "[a-z]+")
+        self.assertEqual(_grep_regex("[]a]"), "[]a]")
+        self.assertEqual(_grep_regex("[^]a]"), "[^]a]")
+
+        self.assertIsNone(_grep_regex(r"[\s]"))
+        self.assertIsNone(_grep_regex("[[:space:]]"))
+        self.assertIsNone(_grep_regex("[abc"))
+
+    def test_unsupported(self):
+        self.assertIsNone(_grep_regex("(?i)error"))
+        self.assertIsNone(_grep_regex("(?:a|b)"))
+        self.assertIsNone(_grep_regex("a{2,3}"))
+        self.assertEqual(_grep_regex(r"a\{2\}"), r"a\{2\}")
+
+    def test_bad_news(self):
+        # All of the patterns scanned for after every test can be filtered
+        for pattern in PatternSelector("crm-corosync").get_patterns("BadNews"):
+            self.assertIsNotNone(_grep_regex(pattern), pattern)
+
+
+class GrepFilterTestCase(unittest.TestCase):
+    def test_filter(self):
+        self.assertEqual(_grep_filter([], "^X:"), "")
+        self.assertEqual(_grep_filter(["a b", re.compile("c")], "^X:"),
+                         " | LC_ALL=C.UTF-8 grep -a -E -e '^X:' -e 'a b' -e c")
+
+        # Any regex that can't be translated disables the filter
+        self.assertEqual(_grep_filter(["a", r"\d"], "^X:"), "")
+
+    def test_flags(self):
+        self.assertEqual(_grep_filter([re.compile("a", re.IGNORECASE)], "^X:"), "")
+        self.assertNotEqual(_grep_filter([re.compile("a", re.UNICODE)], "^X:"), "")
+
+    @unittest.skipUnless(shutil.which("grep"), "grep is not available")
+    def test_same_lines(self):
+        # Every line Python matches must also be kept by grep.  Python checks
+        # the lines FileObj passes on, so run them through it first, starting
+        # from how they are read (with a trailing newline).
+        regexes = [r"a\s+b", r"x.y", r"[0-9]+ items\>", r"^start", r"end$",
+                   r"(foo|bar)\.baz", r"\bword\b", r"node1\s", r"rc=[^0]",
+                   r"done\W"]
+        lines = ["a  b", "a\tb", "xéy", "x-y", "12 items>", "start here",
+                 "the end", "bar.baz", "a word.", "sword", "nothing",
+                 "ünïcödé a b", "x☃y", "lost node1", "exit rc=", "all done"]
+
+        delegate = unittest.mock.Mock()
+        fileobj = FileObj.__new__(FileObj)
+        fileobj.offset = "0"
+        fileobj._delegate = delegate  # pylint: disable=protected-access
+        fileobj.async_complete(0, 0, [f"{line}\n" for line in lines], [])
+        seen = delegate.async_complete.call_args[0][2]
+
+        for regex in regexes:
+            cmd = f"printf '%s\\n' \"$@\" {_grep_filter([regex], '^X:')}"
+            out = subprocess.run(["sh", "-c", cmd, "sh"] + lines, capture_output=True,
+                                 check=False).stdout.decode("utf-8").splitlines()
+
+            for line in seen:
+                if re.search(regex, line):
+                    self.assertIn(line, out, f"{regex} {line}")